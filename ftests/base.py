@@ -42,18 +42,15 @@ class FunctionalTest(LiveServerTestCase):
             num_seeds_per_chain: The number of seeds to add to each chain.
         """
         game = Game(name=name)
-        game.full_clean()
         game.save()
 
         for n in range(nchains):
             chain = Chain(game=game, name='chain {}'.format(n))
-            chain.full_clean()
             chain.save()
 
             for seed_ix in range(num_seeds_per_chain):
                 seed_file = File(open(self.path_to_test_audio(), 'rb'))
                 seed_message = Message(chain=chain, audio=seed_file)
-                seed_message.full_clean()
                 seed_message.save()
                 seed_file.close()
 
@@ -62,7 +59,7 @@ class FunctionalTest(LiveServerTestCase):
             with open(self.path_to_test_audio(), 'rb') as test_audio_handle:
                 test_audio = File(test_audio_handle)
                 child = Message(chain=chain, parent=parent, audio=test_audio)
-                child.full_clean()
+                child.full_clean()  # populates generation from the parent
                 child.save()
                 parent.kill()
 
@@ -196,7 +193,7 @@ class FunctionalTest(LiveServerTestCase):
 
     def assert_alert_message_contains(self, expected):
         alert_message = self.browser.find_element_by_id('alert').text
-        self.assertRegexpMatches(alert_message, expected)
+        self.assertIn(expected, alert_message)
 
     def assert_completion_code_length(self, expected_length):
         completion_code = self.browser.\
@@ -221,7 +218,7 @@ class FunctionalTest(LiveServerTestCase):
 
     def assert_audio_src(self, expected):
         audio_src = self.browser.find_element_by_id('sound').get_attribute('src')
-        self.assertRegexpMatches(audio_src, expected)
+        self.assertIn(expected, audio_src)
 
     # Inspect view
 
@@ -41,7 +41,7 @@ class MakeGameTest(FunctionalTest):
 
         # He is redirected to the inspect view for the game
         page_title = self.browser.find_element_by_tag_name('h1').text
-        self.assertRegexpMatches(page_title, new_game_name)
+        self.assertIn(new_game_name, page_title)
 
         # He returns to the game list page
         self.browser.find_element_by_id('id_games_list').click()
@@ -52,7 +52,7 @@ class MakeGameTest(FunctionalTest):
         self.assertEquals(len(games), 1)
         my_new_game = games[0]
         my_new_game_name = my_new_game.find_element_by_tag_name('h2').text
-        self.assertRegexpMatches(my_new_game_name, new_game_name)
+        self.assertIn(new_game_name, my_new_game_name)
 
     def test_make_game_with_multiple_chains(self):
         """Make a game with multiple chains."""
@@ -88,7 +88,7 @@ class MakeGameTest(FunctionalTest):
         self.assertEquals(len(games), 1)
         my_new_game = games[0]
         my_new_game_name = my_new_game.find_element_by_tag_name('h2').text
-        self.assertRegexpMatches(my_new_game_name, new_game_name)
+        self.assertIn(new_game_name, my_new_game_name)
 
     def test_make_game_with_multiple_seeds_per_chain(self):
         """Marcus makes a game with two seeds in each chain."""
@@ -154,7 +154,7 @@ class ParallelBranchTest(FunctionalTest):
 
         # Save the url of the first seed
         first_seed = self.get_current_audio_url()
-        self.assertRegexpMatches(first_seed, 'seed', 'message was not a seed')
+        self.assertIn('seed', first_seed, 'message was not a seed')
 
         # Lynn makes her response and leaves
         self.upload_file()
@@ -170,7 +170,7 @@ class ParallelBranchTest(FunctionalTest):
 
         # Marcus does not hear the same seed that Lynn heard
         second_seed = self.get_current_audio_url()
-        self.assertRegexpMatches(second_seed, 'seed', 'message was not a seed')
+        self.assertIn('seed', second_seed, 'message was not a seed')
         self.assertNotEqual(first_seed, second_seed)
 
         # Marcus makes his recording and leaves
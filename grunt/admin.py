@@ -22,10 +22,13 @@ class GameAdmin(admin.ModelAdmin):
 class ChainAdmin(admin.ModelAdmin):
     list_display = ('id', 'name', 'game')
     list_filter = ('game', )
+    list_select_related = ('game', )
 
 
 @admin.register(Message)
 class MessageAdmin(admin.ModelAdmin):
     list_display = ('id', 'chain', 'generation', 'parent', 'audio', 'num_children', 'rejected', 'verified')
     list_filter = ('chain', 'rejected', 'verified')
+    # str(chain) shows the game and str(parent) hashes the parent's chain
+    list_select_related = ('chain__game', 'parent__chain')
     actions = [reject_message, verify_message]
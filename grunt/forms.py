@@ -12,12 +12,28 @@ class ResponseForm(forms.ModelForm):
         model = Message
         fields = ('parent', 'audio')
 
-    def save(self, **kwargs):
-        """Create a new message and populate fields from parent."""
-        message = super(ResponseForm, self).save(**kwargs)
+    def __init__(self, *args, **kwargs):
+        """Load the parent's chain and game along with the parent.
+
+        Saving the response copies the parent's chain and names the audio
+        file after the chain's game, so fetch them in the same query.
+        """
+        super(ResponseForm, self).__init__(*args, **kwargs)
+        self.fields['parent'].queryset = Message.objects.select_related(
+            'chain__game'
+        )
+
+    def save(self, commit=True):
+        """Create a new message and populate fields from parent.
+
+        The fields are populated before the message is first saved so that
+        creating a response takes a single INSERT.
+        """
+        message = super(ResponseForm, self).save(commit=False)
         message.chain = message.parent.chain
         message.generation = message.parent.generation + 1
-        message.save()
+        if commit:
+            message.save()
         return message
 
 
@@ -85,14 +101,14 @@ class NewChainForm(forms.ModelForm):
         """Create a new chain and then create seed messages for it."""
         chain = super(NewChainForm, self).save(**kwargs)
 
-        # Create multiple seed messages for this chain.
+        # Create multiple seed messages for this chain in a single query.
         # Assume they are verified.
-        for seed_field_name in self.seed_fields:
-            chain.messages.create(
-                audio=self.cleaned_data[seed_field_name],
-                num_children=self.NUM_CHILDREN_PER_SEED,
-                verified=True,
-            )
+        seeds = [Message(chain=chain,
+                         audio=self.cleaned_data[seed_field_name],
+                         num_children=self.NUM_CHILDREN_PER_SEED,
+                         verified=True)
+                 for seed_field_name in self.seed_fields]
+        Message.objects.bulk_create(seeds)
 
         return chain
 
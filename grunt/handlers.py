@@ -1,7 +1,6 @@
 from unipath import Path
 import pydub
 
-from django.utils.text import slugify
 
 def message_file_name(instance, filename):
     """ Message instance must have a chain or a parent to be saved.
@@ -10,14 +9,12 @@ def message_file_name(instance, filename):
     """
     try:
         chain = instance.chain or instance.parent.chain
-        game_dir = slugify(chain.game.name)
-        chain_dir = slugify(chain.name)
         if instance.parent:
             gen = instance.parent.generation + 1
             message_name = 'gen-'+str(gen)
         else:
             message_name = 'seed'
-        return '{}/{}/{}.wav'.format(game_dir, chain_dir, message_name)
+        return '{}/{}.wav'.format(chain.dirname, message_name)
     except AttributeError:
         return 'bin/{}'.format(filename)
 
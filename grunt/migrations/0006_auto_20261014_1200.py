@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import models, migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('grunt', '0005_message_verified'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='message',
+            name='generation',
+            field=models.IntegerField(default=0, editable=False, db_index=True),
+        ),
+        migrations.AlterIndexTogether(
+            name='message',
+            index_together=set([('chain', 'generation')]),
+        ),
+    ]
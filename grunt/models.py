@@ -1,6 +1,9 @@
 import hashlib
+import random
 
 from django.db import models
+from django.utils.functional import cached_property
+from django.utils.text import slugify
 
 from rest_framework import serializers
 
@@ -16,18 +19,21 @@ class Game(models.Model):
 
         TODO: move this function to handlers
         """
-        if not receipts:
-            receipts = []
-        families = Message.objects.filter(id__in=receipts).values_list(
-            'chain', flat=True
-        )
-        available_chains = self.chains.exclude(id__in=families)
+        available_chains = self.chains.all()
+        if receipts:
+            families = Message.objects.filter(id__in=receipts).values_list(
+                'chain', flat=True
+            )
+            available_chains = available_chains.exclude(id__in=families)
+        # Sample from the primary keys in Python rather than ordering
+        # the whole table randomly in the database.
+        available_chain_ids = list(available_chains.values_list('pk', flat=True))
         try:
-            selected_chain = available_chains.order_by('?')[0]
+            selected_chain_id = random.choice(available_chain_ids)
         except IndexError:
             raise Chain.DoesNotExist()
         else:
-            return selected_chain.pick_parent()
+            return Chain.pick_parent_from_chain(selected_chain_id)
 
     def get_messages_by_generation(self, generation=-1):
         """Filter this game's messages by generation.
@@ -57,6 +63,11 @@ class Game(models.Model):
         )
         return aggregation['max_gen']
 
+    @cached_property
+    def dirname(self):
+        """The directory holding this game's audio files."""
+        return slugify(self.name)
+
     def __str__(self):
         return 'G{} {}'.format(self.id, self.name)
 
@@ -71,23 +82,51 @@ class Chain(models.Model):
 
         TODO: move this function to handlers
         """
-        fertile = self.messages.filter(
+        return self.pick_parent_from_chain(self.pk)
+
+    @staticmethod
+    def pick_parent_from_chain(chain_id):
+        """Select a fertile message from the chain with this id at random.
+
+        Taking the id lets Game.pick_next_message pick a parent
+        without loading the chain it selected.
+        """
+        fertile = Message.objects.filter(
+            chain_id=chain_id
+        ).filter(
             num_children__gt=0
         ).filter(
             rejected=False
         )
-        youngest_generation = fertile.aggregate(
-            min_gen=models.Min('generation')
-        )['min_gen']
-        available_parents = fertile.filter(
-            generation=youngest_generation
-        )
+        # Let the database order the candidates by generation and keep
+        # only the leading run, so the youngest generation is found in
+        # the same query that lists the available parents.
+        candidates = fertile.order_by('generation').values_list(
+            'pk', 'generation'
+        ).iterator()
+        available_parent_ids = []
+        youngest_generation = None
+        for message_id, generation in candidates:
+            if youngest_generation is None:
+                youngest_generation = generation
+            elif generation != youngest_generation:
+                break
+            available_parent_ids.append(message_id)
         try:
-            selected_message = available_parents.order_by('?')[0]
+            selected_message_id = random.choice(available_parent_ids)
         except IndexError:
             raise Message.DoesNotExist()
         else:
-            return selected_message
+            return Message.objects.get(pk=selected_message_id)
+
+    @cached_property
+    def dirname(self):
+        """The directory holding this chain's audio files.
+
+        Cached so that saving many messages to the same chain instance
+        only looks up the game and slugifies the names once.
+        """
+        return '{}/{}'.format(self.game.dirname, slugify(self.name))
 
     def __str__(self):
         return '{} - {}'.format(self.game, self.name)
@@ -98,7 +137,8 @@ class Message(models.Model):
     chain = models.ForeignKey(Chain, blank=True, null=True,
                               related_name='messages')
     parent = models.ForeignKey('self', blank=True, null=True)
-    generation = models.IntegerField(default=0, editable=False)
+    generation = models.IntegerField(default=0, editable=False,
+                                     db_index=True)
     audio = models.FileField(upload_to=message_file_name)
     start_at = models.FloatField(default=0.0)
     end_at = models.FloatField(null=True, blank=True)
@@ -106,8 +146,14 @@ class Message(models.Model):
     verified = models.BooleanField(default=False)
     num_children = models.IntegerField(default=1)
 
+    class Meta:
+        # Parents are picked by ordering a chain's messages by generation
+        index_together = [('chain', 'generation')]
+
     def full_clean(self, *args, **kwargs):
-        if not self.generation and self.parent:
+        # Check parent_id so that messages without a parent don't need
+        # to go through the related object descriptor.
+        if not self.generation and self.parent_id is not None:
             self.generation = self.parent.generation + 1
         return super(Message, self).full_clean(*args, **kwargs)
 
@@ -134,7 +180,7 @@ class Message(models.Model):
         str(message) is used to label the choices in surveys!
         """
         return hashlib.sha224('{}-{}-{}'.format(
-            self.chain.game.id, self.chain.id, self.id
+            self.chain.game_id, self.chain_id, self.id
         )).hexdigest()[:10]
 
 
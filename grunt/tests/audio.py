@@ -0,0 +1,8 @@
+from django.conf import settings
+from unipath import Path
+
+TEST_AUDIO_PATH = Path(settings.APP_DIR, 'grunt/tests/media/test-audio.wav')
+
+# read the test file once for every test module that uploads it
+with open(TEST_AUDIO_PATH, 'rb') as test_audio_handle:
+    TEST_AUDIO = test_audio_handle.read()
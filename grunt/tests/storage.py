@@ -0,0 +1,43 @@
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import Storage
+from django.test import override_settings
+from django.utils.encoding import filepath_to_uri
+from django.utils.six.moves.urllib.parse import urljoin
+
+
+class InMemoryStorage(Storage):
+    """Keep saved files in a dict instead of writing them to disk.
+
+    Decorate test classes with in_memory_storage so that tests saving
+    audio files don't share a media directory on disk.
+    """
+    def __init__(self, base_url=None):
+        self.files = {}
+        if base_url is None:
+            base_url = settings.MEDIA_URL
+        self.base_url = base_url
+
+    def _open(self, name, mode='rb'):
+        return ContentFile(self.files[name], name=name)
+
+    def _save(self, name, content):
+        self.files[name] = b''.join(content.chunks())
+        return name
+
+    def delete(self, name):
+        self.files.pop(name, None)
+
+    def exists(self, name):
+        return name in self.files
+
+    def size(self, name):
+        return len(self.files[name])
+
+    def url(self, name):
+        return urljoin(self.base_url, filepath_to_uri(name))
+
+
+IN_MEMORY_STORAGE = 'grunt.tests.storage.InMemoryStorage'
+
+in_memory_storage = override_settings(DEFAULT_FILE_STORAGE=IN_MEMORY_STORAGE)
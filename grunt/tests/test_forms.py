@@ -1,31 +1,28 @@
 
-from django.conf import settings
-from django.core.files import File
-from django.test import TestCase, override_settings
+from django.core.files.base import ContentFile
+from django.test import TestCase
 
 from model_mommy import mommy
-from unipath import Path
 
 from grunt.models import Game
 from grunt.forms import ResponseForm, NewChainForm
+from grunt.tests.audio import TEST_AUDIO
+from grunt.tests.storage import in_memory_storage
 
-TEST_MEDIA_ROOT = Path(settings.MEDIA_ROOT + '-test')
 
-
-@override_settings(MEDIA_ROOT=TEST_MEDIA_ROOT)
+@in_memory_storage
 class FormTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.seed = mommy.make_recipe('grunt.seed')
+
     def setUp(self):
         super(FormTest, self).setUp()
-        self.seed = mommy.make_recipe('grunt.seed')
-        test_audio_path = Path(
-            settings.APP_DIR,
-            'grunt/tests/media/test-audio.wav'
-        )
-        self.audio = File(open(test_audio_path, 'rb'))
+        self.audio = ContentFile(TEST_AUDIO, name='test-audio.wav')
 
     def tearDown(self):
         self.audio.close()
-        TEST_MEDIA_ROOT.rmtree()
+        super(FormTest, self).tearDown()
 
 
 class ResponseFormTest(FormTest):
@@ -1,55 +1,60 @@
 
-from django.conf import settings
-from django.core.files import File
-from django.test import TestCase, override_settings
+from django.core.files.base import ContentFile
+from django.test import TestCase
 
 from model_mommy import mommy
-from unipath import Path
 
 from grunt.models import Game, Chain, Message
+from grunt.tests.audio import TEST_AUDIO
+from grunt.tests.storage import in_memory_storage
 
-TEST_MEDIA_ROOT = Path(settings.MEDIA_ROOT + '-test')
 
-
-@override_settings(MEDIA_ROOT=TEST_MEDIA_ROOT)
+@in_memory_storage
 class ModelTest(TestCase):
-    def tearDown(self):
-        """Remove the test media root."""
-        TEST_MEDIA_ROOT.rmtree()
+    pass
 
 
 class GameTest(ModelTest):
     def test_make_a_game(self):
         """Make a game."""
         game = Game(name='New Game')
-        game.full_clean()
-        game.save()
+        game.full_clean()  # should not raise
 
     def test_get_messages_by_generation(self):
         """Select messages from a game by generation."""
         game = mommy.make(Game)
         chains = mommy.make(Chain, game=game, _quantity=2)
-        expected = []
-        for chain in chains:
-            first = mommy.make(Message, chain=chain)
-            second = mommy.make(Message, chain=chain, parent=first, generation=1)
-            expected.append(first)
+        expected = [mommy.make(Message, chain=chain) for chain in chains]
+        Message.objects.bulk_create([
+            Message(chain=first.chain, parent=first, generation=1)
+            for first in expected
+        ])
+
+        actual = game.get_messages_by_generation(0).values_list('pk', flat=True)
+        self.assertItemsEqual(actual, [message.pk for message in expected])
 
-        actual = game.get_messages_by_generation(0)
-        for e, a in zip(expected, actual):
-            self.assertEquals(e, a)
+    def test_pick_next_message_queries(self):
+        """Picking a message shouldn't take a query per chain."""
+        game = mommy.make(Game)
+        chains = mommy.make(Chain, game=game, _quantity=5)
+        receipt = mommy.make(Message, chain=chains[0])
+        for chain in chains[1:]:
+            mommy.make(Message, chain=chain)
+
+        # list chains, list parents, get parent
+        with self.assertNumQueries(3):
+            game.pick_next_message([receipt.pk, ])
 
 
 class ChainTest(ModelTest):
-    def setUp(self):
-        super(ChainTest, self).setUp()
-        self.game = mommy.make(Game)
+    @classmethod
+    def setUpTestData(cls):
+        cls.game = mommy.make(Game)
 
     def test_make_a_chain(self):
         """Make a chain."""
         chain = Chain(game=self.game, name='New Chain')
-        chain.full_clean()
-        chain.save()
+        chain.full_clean()  # should not raise
 
     def test_pick_youngest_parent(self):
         """Chains should pick the youngest parent message.
@@ -57,7 +62,7 @@ class ChainTest(ModelTest):
         This is not a good test because it won't always fail even if
         the picking isn't implemented correctly!
         """
-        chain = mommy.make(Chain)
+        chain = mommy.make(Chain, game=self.game)
         young = mommy.make(Message, chain=chain)
         old = mommy.make(Message, chain=chain, generation=1)
         parent = chain.pick_parent()
@@ -65,20 +70,30 @@ class ChainTest(ModelTest):
 
     def test_ignore_rejected_messages(self):
         """Chains should only pick from messages that haven't been rejected."""
-        chain = mommy.make(Chain)
+        chain = mommy.make(Chain, game=self.game)
         rejected = mommy.make(Message, chain=chain, rejected=True)
         with self.assertRaises(Message.DoesNotExist):
             chain.pick_parent()
 
+    def test_pick_parent_queries(self):
+        """Picking a parent shouldn't take a query per message."""
+        chain = mommy.make(Chain, game=self.game)
+        mommy.make(Message, chain=chain, _quantity=5)
+
+        # list parents, get parent
+        with self.assertNumQueries(2):
+            chain.pick_parent()
+
 
 class MessageTest(ModelTest):
+    @classmethod
+    def setUpTestData(cls):
+        cls.chain = mommy.make(Chain)
+
     def setUp(self):
         super(MessageTest, self).setUp()
-        self.chain = mommy.make(Chain)
-
         # test file for models.FileField
-        fpath = Path(settings.APP_DIR, 'grunt/tests/media/test-audio.wav')
-        self.audio = File(open(fpath, 'rb'))
+        self.audio = ContentFile(TEST_AUDIO, name='test-audio.wav')
 
     def tearDown(self):
         super(MessageTest, self).tearDown()
@@ -94,6 +109,5 @@ class MessageTest(ModelTest):
         """Make a message."""
         seed = mommy.make_recipe('grunt.seed')
         message = Message(parent=seed, audio=self.audio)
-        message.full_clean()
         message.save()
         self.assertEquals(message.parent, seed)
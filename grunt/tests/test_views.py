@@ -1,27 +1,22 @@
 from django.conf import settings
-from django.core.files import File
+from django.core.files.base import ContentFile
 from django.core.urlresolvers import reverse
-from django.test import TestCase, override_settings
+from django.test import TestCase
 
-from unipath import Path
 from model_mommy import mommy
+from unipath import Path
 
 from grunt.models import Game, Chain, Message
 from grunt.forms import NewGameForm
+from grunt.tests.audio import TEST_AUDIO
+from grunt.tests.storage import in_memory_storage
 
-TEST_MEDIA_ROOT = Path(settings.MEDIA_ROOT + '-test')
+# kept out of grunt/fixtures so that loaddata can't find it by name
+VIEW_GAME_FIXTURE = Path(settings.APP_DIR, 'grunt/tests/fixtures/view_game.json')
 
 
-@override_settings(MEDIA_ROOT=TEST_MEDIA_ROOT)
+@in_memory_storage
 class ViewTest(TestCase):
-    def setUp(self):
-        self.audio_path = Path(
-            settings.APP_DIR,
-            'grunt/tests/media/test-audio.wav')
-
-    def tearDown(self):
-        TEST_MEDIA_ROOT.rmtree()
-
     def make_session(self, game, instructed=False, receipts=None):
         game_url = reverse('play', kwargs={'pk': game.pk})
         self.client.get(game_url)
@@ -44,7 +39,9 @@ class GameListViewTest(ViewTest):
 
     def test_games_show_up_on_home_page(self):
         num_games = 10
-        mommy.make(Game, _quantity=num_games)
+        Game.objects.bulk_create([
+            Game(name='game {}'.format(n)) for n in range(num_games)
+        ])
         response = self.client.get(self.game_list_url)
         visible_games = response.context['game_list']
         self.assertEqual(len(visible_games), num_games)
@@ -56,13 +53,28 @@ class GameListViewTest(ViewTest):
         self.assertEquals(top_game, newer_game)
 
 
-class TelephoneViewTest(ViewTest):
-    def setUp(self):
-        super(TelephoneViewTest, self).setUp()
-        self.game = mommy.make(Game)
-        self.game_play_url = reverse('play', kwargs={'pk': self.game.pk})
-        self.chain = mommy.make(Chain, game=self.game)
-        self.message = mommy.make(Message, chain=self.chain)
+class FixtureGameViewTest(ViewTest):
+    """Load a game with a single chain and seed message once per class."""
+    fixtures = [VIEW_GAME_FIXTURE, ]
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.message = Message.objects.select_related('chain__game').get()
+        cls.chain = cls.message.chain
+        cls.game = cls.chain.game
+
+        # The fixture only names the seed's audio file, so save the file
+        # itself for tests that open it.
+        cls.message.audio.storage.save(
+            cls.message.audio.name, ContentFile(TEST_AUDIO)
+        )
+
+
+class TelephoneViewTest(FixtureGameViewTest):
+    @classmethod
+    def setUpTestData(cls):
+        super(TelephoneViewTest, cls).setUpTestData()
+        cls.game_play_url = reverse('play', kwargs={'pk': cls.game.pk})
 
     def test_get_instructions_page(self):
         """ First visit should render instructions template. """
@@ -91,15 +103,12 @@ class TelephoneViewTest(ViewTest):
         self.assertEquals(response.context['game'], self.game)
 
 
-class SwitchboardViewTest(ViewTest):
-    def setUp(self):
-        super(SwitchboardViewTest, self).setUp()
-        self.game = mommy.make(Game)
-        self.chain = mommy.make(Chain, game=self.game)
-        self.message = mommy.make(Message, chain=self.chain)
-
-        self.switchboard_url = reverse('switchboard',
-                                       kwargs={'pk': self.game.pk})
+class SwitchboardViewTest(FixtureGameViewTest):
+    @classmethod
+    def setUpTestData(cls):
+        super(SwitchboardViewTest, cls).setUpTestData()
+        cls.switchboard_url = reverse('switchboard',
+                                      kwargs={'pk': cls.game.pk})
 
     def test_successful_post_returns_next_message(self):
         second_chain = mommy.make(Chain, game=self.game)
@@ -125,11 +134,9 @@ class SwitchboardViewTest(ViewTest):
                       second_chain.messages.values_list('id', flat=True))
 
     def post_response(self):
-        with open(self.audio_path, 'rb') as audio_handle:
-            audio_file = File(audio_handle)
-            post_data = {'parent': self.message.pk, 'audio': audio_file}
-            response = self.client.post(self.switchboard_url, post_data)
-        return response
+        audio_file = ContentFile(TEST_AUDIO, name='test-audio.wav')
+        post_data = {'parent': self.message.pk, 'audio': audio_file}
+        return self.client.post(self.switchboard_url, post_data)
 
     def test_post_a_message(self):
         """ Post a message """
@@ -211,17 +218,16 @@ class NewGameViewTest(ViewTest):
         game = mommy.make(Game)
         add_chains_url = reverse('new_chains', kwargs={'pk': game.pk})
         new_chain_name = 'new chain name'
-        with open(self.audio_path, 'rb') as audio_handle:
-            audio_file = File(audio_handle)
-            new_chain_formset_data = {
-                'form-TOTAL_FORMS': '1',
-                'form-INITIAL_FORMS': '0',
-                'form-MAX_NUM_FORMS': '',
-                'form-0-game': game.pk,
-                'form-0-name': new_chain_name,
-                'form-0-seed0': audio_file
-            }
-            self.client.post(add_chains_url, new_chain_formset_data)
+        audio_file = ContentFile(TEST_AUDIO, name='test-audio.wav')
+        new_chain_formset_data = {
+            'form-TOTAL_FORMS': '1',
+            'form-INITIAL_FORMS': '0',
+            'form-MAX_NUM_FORMS': '',
+            'form-0-game': game.pk,
+            'form-0-name': new_chain_name,
+            'form-0-seed0': audio_file
+        }
+        self.client.post(add_chains_url, new_chain_formset_data)
 
         self.assertEquals(game.chains.count(), 1)
         chain = game.chains.first()
@@ -234,8 +240,8 @@ class NewGameViewTest(ViewTest):
         add_chains_url += '?num_seeds_per_chain=2'
         new_chain_name = 'new chain name'
 
-        seed0 = File(open(self.audio_path, 'rb'))
-        seed1 = File(open(self.audio_path, 'rb'))
+        seed0 = ContentFile(TEST_AUDIO, name='seed0.wav')
+        seed1 = ContentFile(TEST_AUDIO, name='seed1.wav')
 
         new_chain_formset_data = {
             'form-TOTAL_FORMS': '1',
@@ -249,9 +255,6 @@ class NewGameViewTest(ViewTest):
 
         self.client.post(add_chains_url, new_chain_formset_data)
 
-        seed0.close()
-        seed1.close()
-
         self.assertEquals(game.chains.count(), 1)
         chain = game.chains.first()
         self.assertEquals(chain.name, new_chain_name)
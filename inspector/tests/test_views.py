@@ -1,11 +1,15 @@
 from __future__ import unicode_literals
+from unittest import skipUnless
 
+from django.conf import settings
 from django.core.urlresolvers import reverse
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
+import mock
 from model_mommy import mommy
 
-from grunt.models import Game
+from grunt.models import Game, Chain
+from inspector.views import GameViewSet
 
 
 class InspectViewTest(TestCase):
@@ -23,3 +27,32 @@ class InspectViewTest(TestCase):
         """ The game should be sent to the template for rendering. """
         response = self.client.get(self.inspect_game_url)
         self.assertIn('game', response.context)
+
+
+@skipUnless('nplusone.ext.django' in settings.INSTALLED_APPS,
+            'n+1 queries are only detected with --settings=settings.test')
+class GameViewSetTest(TestCase):
+
+    def setUp(self):
+        mommy.make(Chain, _quantity=2)
+        self.games_url = reverse('game-list')
+
+    def test_list_games(self):
+        """ Listing games with their chains should not raise. """
+        response = self.client.get(self.games_url)
+        self.assertEquals(response.status_code, 200)
+
+    def test_lazy_loading_chains_raises(self):
+        """ Loading each game's chains one at a time should fail the test. """
+        from nplusone.core.exceptions import NPlusOneError
+        with mock.patch.object(GameViewSet, 'queryset', Game.objects.all()):
+            with self.assertRaises(NPlusOneError):
+                self.client.get(self.games_url)
+
+    @override_settings(DEBUG=False)
+    def test_lazy_loading_chains_raises_with_overridden_settings(self):
+        """ Overriding unrelated settings shouldn't hide n+1 queries. """
+        from nplusone.core.exceptions import NPlusOneError
+        with mock.patch.object(GameViewSet, 'queryset', Game.objects.all()):
+            with self.assertRaises(NPlusOneError):
+                self.client.get(self.games_url)
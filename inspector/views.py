@@ -42,5 +42,7 @@ class MessageViewSet(viewsets.ModelViewSet):
 
 
 class GameViewSet(viewsets.ReadOnlyModelViewSet):
-    queryset = Game.objects.all()
+    # GameSerializer nests chains and their messages, so fetch each level
+    # in a single query instead of one query per chain.
+    queryset = Game.objects.prefetch_related('chains__messages')
     serializer_class = GameSerializer
@@ -30,7 +30,8 @@ class ResponseForm(forms.ModelForm):
         self.fields['selection'].label = 'Select the sound most like the imitation above.'
 
         if 'question' in self.initial:
-            message_choices = self.initial['question'].choices.all()
+            # choices are labeled with str(message), which needs the chain
+            message_choices = self.initial['question'].choices.select_related('chain')
             self.fields['selection'].queryset = message_choices
             choice_labels = list(string.letters[:len(message_choices)])
             choice_map = [(message.id, label) for message, label in zip(message_choices, choice_labels)]
@@ -59,9 +60,15 @@ class MessageIdField(forms.Field):
             raise ValidationError('Messages must be given as ints')
 
     def validate(self, value):
-        all_message_ids = Message.objects.values_list('id', flat=True)
+        if not value:
+            return
+
+        # Only load the ids that were asked for, not every message id.
+        found_message_ids = set(
+            Message.objects.filter(id__in=value).values_list('id', flat=True)
+        )
         for message_id in value:
-            if message_id not in all_message_ids:
+            if message_id not in found_message_ids:
                 raise ValidationError('Message not found')
 
 
@@ -1,17 +1,13 @@
-from unipath import Path
-
-from django.conf import settings
-from django.core.files import File
+from django.core.files.base import ContentFile
 
 from model_mommy.recipe import Recipe, foreign_key, related
 
 import grunt.models as grunt_models
 import ratings.models as ratings_models
+from grunt.tests.audio import TEST_AUDIO, TEST_AUDIO_PATH
 
 
-django_file_path = Path(settings.APP_DIR, 'grunt/tests/media/test-audio.wav')
-assert django_file_path.exists()
-django_file = File(open(django_file_path, 'rb'))
+django_file = ContentFile(TEST_AUDIO, name=TEST_AUDIO_PATH.name)
 
 chain = Recipe(grunt_models.Chain,
     name = 'mommy_chain')
@@ -1,21 +1,17 @@
-from django.conf import settings
 from django.core.exceptions import ValidationError
-from django.test import TestCase, override_settings
+from django.test import TestCase
 
 from model_mommy import mommy
-from unipath import Path
 
 from grunt.models import Message, Chain
+from grunt.tests.storage import in_memory_storage
 from ratings.models import Survey
 from ratings.forms import NewSurveyForm, CreateQuestionForm
 
-TEST_MEDIA_ROOT = Path(settings.MEDIA_ROOT + '-test')
 
-@override_settings(MEDIA_ROOT = TEST_MEDIA_ROOT)
+@in_memory_storage
 class RatingsModelTest(TestCase):
-    def tearDown(self):
-        super(RatingsModelTest, self).tearDown()
-        TEST_MEDIA_ROOT.rmtree()
+    pass
 
 
 class NewSurveyFormTest(RatingsModelTest):
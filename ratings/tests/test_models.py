@@ -1,27 +1,24 @@
-from django.conf import settings
-from django.test import TestCase, override_settings
+from django.db.models import Count
+from django.test import TestCase
 
 from model_mommy import mommy
-from unipath import Path
 
+from grunt.tests.storage import in_memory_storage
 from ratings.models import Survey, Question, Response
 
-TEST_MEDIA_ROOT = Path(settings.MEDIA_ROOT + '-test')
 
-@override_settings(MEDIA_ROOT=TEST_MEDIA_ROOT)
+@in_memory_storage
 class RatingsModelTest(TestCase):
-    def tearDown(self):
-        super(RatingsModelTest, self).tearDown()
-        TEST_MEDIA_ROOT.rmtree()
+    pass
 
 
 class SurveyModelTest(RatingsModelTest):
-    def setUp(self):
-        super(SurveyModelTest, self).setUp()
-        self.survey = mommy.make(Survey)
-        self.questions = mommy.make_recipe(
+    @classmethod
+    def setUpTestData(cls):
+        cls.survey = mommy.make(Survey)
+        cls.questions = mommy.make_recipe(
             'ratings.empty_question',
-            survey=self.survey,
+            survey=cls.survey,
             _quantity=5
         )
 
@@ -54,8 +51,7 @@ class QuestionModelTest(RatingsModelTest):
         survey = mommy.make(Survey)
         given, answer = mommy.make_recipe('ratings.recording', _quantity=2)
         question = Question(survey=survey, given=given, answer=answer)
-        question.full_clean()
-        question.save()  # should not raise
+        question.full_clean()  # should not raise
 
     def test_add_choices_to_question(self):
         """Add choices to an empty question."""
@@ -76,23 +72,29 @@ class QuestionModelTest(RatingsModelTest):
         )
         question1.choices.add(*messages)
         question2.choices.add(*messages)
-        self.assertEquals(question1.choices.count(), num_choices)
-        self.assertEquals(question2.choices.count(), num_choices)
+        num_choices_by_question = dict(
+            Question.objects.filter(pk__in=[question1.pk, question2.pk])
+                            .annotate(num_choices=Count('choices'))
+                            .values_list('pk', 'num_choices')
+        )
+        self.assertEquals(num_choices_by_question, {
+            question1.pk: num_choices,
+            question2.pk: num_choices,
+        })
 
 
 class ResponseModelTest(RatingsModelTest):
-    def setUp(self):
-        super(ResponseModelTest, self).setUp()
-        self.question = mommy.make_recipe('ratings.empty_question')
+    @classmethod
+    def setUpTestData(cls):
+        cls.question = mommy.make_recipe('ratings.empty_question')
         num_choices = 4
         choices = mommy.make_recipe('ratings.recording', _quantity=num_choices)
-        self.question.choices.add(*choices)
+        cls.question.choices.add(*choices)
 
     def test_submit_a_response(self):
         selection = mommy.make_recipe('ratings.recording')
         response = Response(question=self.question, selection=selection)
-        response.full_clean()
-        response.save()  # should not raise
+        response.full_clean()  # should not raise
 
     def test_allow_multiple_responses_per_question(self):
         selection = mommy.make_recipe('ratings.recording')
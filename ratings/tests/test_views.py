@@ -1,25 +1,21 @@
 from unittest import skip
-from unipath import Path
 
-from django.conf import settings
 from django.core.urlresolvers import reverse
-from django.test import TestCase, override_settings
+from django.test import TestCase
 from django.utils.six import BytesIO
 
 from model_mommy import mommy
 from rest_framework.parsers import JSONParser
 
 from grunt.models import Message
+from grunt.tests.storage import in_memory_storage
 from ratings.models import Survey, Question, Response
 from ratings.forms import NewSurveyForm, ResponseForm
 
-TEST_MEDIA_ROOT = Path(settings.MEDIA_ROOT + '-test')
 
-@override_settings(MEDIA_ROOT=TEST_MEDIA_ROOT)
+@in_memory_storage
 class RatingsViewTest(TestCase):
-    def tearDown(self):
-        super(RatingsViewTest, self).tearDown()
-        TEST_MEDIA_ROOT.rmtree()
+    pass
 
 
 class SurveyViewTest(RatingsViewTest):
@@ -47,22 +43,23 @@ class SurveyViewTest(RatingsViewTest):
         num_questions = 10
         survey = mommy.make(Survey)
         givens = mommy.make(Message, _fill_optional=['chain'], _quantity=num_questions)
-        for g in givens:
-            mommy.make(Question, survey=survey, given=g)
+        Question.objects.bulk_create([
+            Question(survey=survey, given=g) for g in givens
+        ])
         response = self.client.get(reverse('inspect_survey', kwargs={'pk':survey.pk}))
         questions = response.context['questions']
         self.assertEquals(len(questions), num_questions)
 
 
 class TakeSurveyTest(RatingsViewTest):
-    def setUp(self):
-        super(RatingsViewTest, self).setUp()
-        self.survey = mommy.make(Survey)
-        given, choice = mommy.make(Message, _fill_optional=['chain', 'audio'], _quantity=2)
-        self.question = mommy.make(Question, given=given, survey=self.survey)
-        self.question.choices.add(choice)
+    @classmethod
+    def setUpTestData(cls):
+        cls.survey = mommy.make(Survey)
+        given, cls.choice = mommy.make(Message, _fill_optional=['chain', 'audio'], _quantity=2)
+        cls.question = mommy.make(Question, given=given, survey=cls.survey)
+        cls.question.choices.add(cls.choice)
 
-        self.survey_url = reverse('take_survey', kwargs={'pk': self.survey.pk})
+        cls.survey_url = reverse('take_survey', kwargs={'pk': cls.survey.pk})
 
     def add_question_to_session(self):
         selection = mommy.make(Message, _fill_optional=['chain', 'audio'])
@@ -90,7 +87,7 @@ class TakeSurveyTest(RatingsViewTest):
     def test_post_a_response(self):
         self.client.get(self.survey_url)  # populates session
         post_data = {'question': self.question.pk,
-                     'selection': self.question.choices.first().pk}
+                     'selection': self.choice.pk}
         self.client.post(self.survey_url, post_data)
 
     def test_completed_players_get_the_completion_page(self):
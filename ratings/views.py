@@ -2,13 +2,14 @@ import string
 
 from django.contrib import messages
 from django.core.urlresolvers import reverse_lazy
+from django.db.models import Prefetch
 from django.http import Http404
 from django.views.generic import ListView, CreateView, DetailView, View
 from django.shortcuts import get_object_or_404, render, redirect
 
 from rest_framework.renderers import JSONRenderer
 
-from grunt.models import MessageSerializer
+from grunt.models import Message, MessageSerializer
 from ratings.models import Survey, Question
 from ratings.forms import NewSurveyForm, ResponseForm
 
@@ -83,7 +84,8 @@ class TakeSurveyView(View):
             return render(request, 'ratings/question.html', context_data)
 
     def prepare_response_form(self, form):
-        message_choices = form.initial['question'].choices.all()
+        # choices are labeled with str(message), which needs the chain
+        message_choices = form.initial['question'].choices.select_related('chain')
         form.fields['selection'].queryset = message_choices
         choice_labels = list(string.letters[:len(message_choices)])
         choice_map = [(message.id, label) for message, label in zip(message_choices, choice_labels)]
@@ -97,5 +99,11 @@ class InspectSurveyView(DetailView):
 
     def get_context_data(self, **kwargs):
         context_data = super(InspectSurveyView, self).get_context_data(**kwargs)
-        context_data['questions'] = context_data['survey'].questions.all()
+        # str(message) needs the message's chain, so fetch the chains of
+        # each question's given message and choices along with them.
+        context_data['questions'] = context_data['survey'].questions.select_related(
+            'given__chain'
+        ).prefetch_related(
+            Prefetch('choices', queryset=Message.objects.select_related('chain'))
+        )
         return context_data
@@ -0,0 +1,16 @@
+import logging
+
+from .local import *
+
+# Fail tests that lazily load related objects row by row
+# https://github.com/jmcarp/nplusone
+INSTALLED_APPS += ('nplusone.ext.django', )
+
+# The subclass keeps reading the NPLUSONE_* settings under override_settings
+MIDDLEWARE_CLASSES = (
+    'telephone.middleware.OverridableNPlusOneMiddleware',
+) + MIDDLEWARE_CLASSES
+
+NPLUSONE_RAISE = True
+NPLUSONE_LOGGER = logging.getLogger('nplusone')
+NPLUSONE_LOG_LEVEL = logging.WARN
@@ -0,0 +1,45 @@
+from django.conf import settings
+
+from nplusone.core import notifiers, signals
+from nplusone.ext.django.middleware import NPlusOneMiddleware
+
+# (signal, handler) pairs that nplusone's listeners connect in setup()
+LISTENER_SIGNALS = [
+    (signals.load, 'handle_load'),
+    (signals.ignore_load, 'handle_ignore'),
+    (signals.lazy_load, 'handle_lazy'),
+    (signals.eager_load, 'handle_eager'),
+    (signals.touch, 'handle_touch'),
+]
+
+
+class OverridableNPlusOneMiddleware(NPlusOneMiddleware):
+    """Detect n+1 queries in tests that override settings.
+
+    NPlusOneMiddleware reads its config from vars(settings._wrapped),
+    which only holds the overridden keys under override_settings, so
+    NPLUSONE_RAISE goes missing. Look the settings up through getattr
+    instead, which falls back to the settings module.
+    """
+    def load_config(self):
+        super(OverridableNPlusOneMiddleware, self).load_config()
+        config = {
+            name: getattr(settings, name)
+            for name in dir(settings) if name.startswith('NPLUSONE_')
+        }
+        self.notifiers = notifiers.init(config)
+
+    def process_response(self, request, response):
+        # nplusone's listeners only disconnect when they are garbage
+        # collected, and the traceback of an NPlusOneError keeps them
+        # alive, so they would go on raising in later tests.
+        request_listeners = list(self.listeners.get(request, {}).values())
+        try:
+            return super(OverridableNPlusOneMiddleware, self).process_response(
+                request, response
+            )
+        finally:
+            for listener in request_listeners:
+                for signal, handler in LISTENER_SIGNALS:
+                    if hasattr(listener, handler):
+                        signal.disconnect(getattr(listener, handler))
@@ -1,7 +1,7 @@
 from __future__ import unicode_literals
 
 from django.conf import settings
-from django.conf.urls import patterns, include, url
+from django.conf.urls import include, url
 from django.conf.urls.static import static
 from django.contrib import admin
 
@@ -12,9 +12,7 @@ from transcribe import views as transcribe_views
 from words import views as words_views
 
 
-urlpatterns = patterns(
-    '',
-
+urlpatterns = [
     # app views
     url(r'^$', grunt_views.GameListView.as_view(), name='games_list'),
     url(r'^new_game/$', grunt_views.NewGameView.as_view(), name='new_game'),
@@ -61,4 +59,4 @@ urlpatterns = patterns(
 
     # admin site
     url(r'^admin/', include(admin.site.urls)),
-) + static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+] + static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
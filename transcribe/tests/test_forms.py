@@ -1,27 +1,28 @@
 import unipath
 from unittest import skip
 
-from django.test import TestCase, override_settings
+from django.test import TestCase
 from django.conf import settings
-from django.core.files import File
+from django.core.files.base import ContentFile
 
 from model_mommy import mommy
 
 from grunt.models import Game, Chain, Message
+from grunt.tests.storage import in_memory_storage
 from transcribe.models import MessageToTranscribe
 from transcribe.forms import NewTranscriptionSurveyForm, TranscriptionForm
 
-TEST_MEDIA_ROOT = unipath.Path(settings.MEDIA_ROOT + '-test')
+CATCH_TRIAL_PATH = unipath.Path(
+    settings.APP_DIR, 'transcribe/tests/media/catch_trial.wav'
+)
+with open(CATCH_TRIAL_PATH, 'rb') as catch_trial_handle:
+    CATCH_TRIAL = catch_trial_handle.read()
 
-@override_settings(MEDIA_ROOT=TEST_MEDIA_ROOT)
+@in_memory_storage
 class TranscribeFormTest(TestCase):
-    def setUp(self):
-        super(TranscribeFormTest, self).setUp()
-        self.game = mommy.make(Game)
-
-    def tearDown(self):
-        super(TranscribeFormTest, self).tearDown()
-        TEST_MEDIA_ROOT.rmtree()
+    @classmethod
+    def setUpTestData(cls):
+        cls.game = mommy.make(Game)
 
 
     def test_make_new_survey(self):
@@ -52,10 +53,7 @@ class TranscribeFormTest(TestCase):
         mommy.make(Message, chain=chain, _quantity=2)
         message_ids = Message.objects.filter(chain=chain.id).values_list('id', flat=True)
 
-        catch_trial_message = unipath.Path(
-            settings.APP_DIR, 'transcribe/tests/media/catch_trial.wav'
-        )
-        catch_trial = File(open(catch_trial_message, 'rb'))
+        catch_trial = ContentFile(CATCH_TRIAL, name='catch_trial.wav')
 
         post_data = {
             'name': 'make survey from message ids',
@@ -75,10 +73,7 @@ class TranscribeFormTest(TestCase):
         mommy.make(Message, chain=chain, _quantity=2)
         message_ids = Message.objects.filter(chain=chain.id).values_list('id', flat=True)
 
-        catch_trial_message = unipath.Path(
-            settings.APP_DIR, 'transcribe/tests/media/catch_trial.wav'
-        )
-        catch_trial = File(open(catch_trial_message, 'rb'))
+        catch_trial = ContentFile(CATCH_TRIAL, name='catch_trial.wav')
 
         post_data = {
             'name': 'make survey from message ids',
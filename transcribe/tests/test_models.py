@@ -1,22 +1,14 @@
-import unipath
-
-from django.conf import settings
-from django.test import TestCase, override_settings
+from django.test import TestCase
 
 from model_mommy import mommy
 
 from grunt.models import Message
+from grunt.tests.storage import in_memory_storage
 from transcribe.models import TranscriptionSurvey, MessageToTranscribe, Transcription
 
 
-TEST_MEDIA_ROOT = unipath.Path(settings.MEDIA_ROOT + '-test')
-
-@override_settings(MEDIA_ROOT=TEST_MEDIA_ROOT)
+@in_memory_storage
 class TranscriptionTest(TestCase):
-    def tearDown(self):
-        super(TranscriptionTest, self).tearDown()
-        TEST_MEDIA_ROOT.rmtree()
-
     def test_return_catch_trial(self):
         catch_trial = mommy.make(Message)
         survey = mommy.make_recipe('transcribe.transcription_survey',
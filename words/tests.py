@@ -1,40 +1,29 @@
-import unipath
-
-from django.conf import settings
-from django.core.files import File
-from django.test import TestCase, override_settings
+from django.core.files.base import ContentFile
+from django.test import TestCase
 
 from model_mommy import mommy
 
 from grunt.models import Message
+from grunt.tests.storage import in_memory_storage
 from words.models import Survey, Question, Response
 from words.forms import NewWordSurveyForm, NewWordQuestionForm
 
 
-TEST_MEDIA_ROOT = unipath.Path(settings.MEDIA_ROOT + '-test')
-
-@override_settings(MEDIA_ROOT=TEST_MEDIA_ROOT)
+@in_memory_storage
 class CreateWordSurveyTest(TestCase):
-    def setUp(self):
-        super(CreateWordSurveyTest, self).setUp()
-        self.words = ['booba', 'kiki']
-        self.words_str = ','.join(self.words)
-
-        self.txt_path = unipath.Path('test-words-upload.txt').absolute()
-        with open(self.txt_path, 'w') as f:
-            for w in self.words:
-                f.write(w+'\n')
-        self.words_file = File(open(self.txt_path, 'r'))
+    @classmethod
+    def setUpTestData(cls):
+        cls.words = ['booba', 'kiki']
+        cls.words_str = ','.join(cls.words)
 
         choices = mommy.make_recipe('ratings.seed', _quantity=4)
-        self.choice_ids = [message.id for message in choices]
-        self.choices_str = ','.join(map(str, self.choice_ids))
-
-    def tearDown(self):
-        super(CreateWordSurveyTest, self).tearDown()
-        TEST_MEDIA_ROOT.rmtree()
-        if self.txt_path.exists():
-            self.txt_path.remove()
+        cls.choice_ids = [message.id for message in choices]
+        cls.choices_str = ','.join(map(str, cls.choice_ids))
+
+    def setUp(self):
+        super(CreateWordSurveyTest, self).setUp()
+        words_txt = ''.join(w+'\n' for w in self.words)
+        self.words_file = ContentFile(words_txt, name='test-words-upload.txt')
 
     def test_create_word_survey(self):
         form_data = dict(